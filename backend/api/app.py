@@ -1,7 +1,8 @@
 """FastAPI app exposing simulation runs as pollable jobs.
 
 This API uses a simple job model because browsers are happiest with plain
-request/response. I run the simulation in a background thread, store
+request/response. I run each simulation in a worker process (simulations are
+CPU-bound, so threads would just queue up behind the GIL), store
 progress/results in memory, and let the frontend poll at a comfortable cadence.
 
 This service is deliberately non-persistent: a process restart clears jobs.
@@ -9,15 +10,23 @@ This service is deliberately non-persistent: a process restart clears jobs.
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import os
 import threading
 import uuid
-from dataclasses import asdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import fields
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+import numba
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 from backend.simulation.models import DemandPeak, MonteCarloResult, SimulationConfig
 from backend.simulation.runner import monte_carlo, run_single
@@ -63,7 +72,13 @@ class SimulationRequest(BaseModel):
 
 
 class JobStatus(BaseModel):
-    """Job metadata returned to the frontend for polling."""
+    """Job metadata returned to the frontend for polling.
+
+    Instances are frozen: updates replace the stored object instead of mutating
+    it, so pollers can read a job without taking the lock.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     job_id: str
     status: str
@@ -99,7 +114,54 @@ def _cfg_from_in(data: SimulationConfigIn) -> SimulationConfig:
     )
 
 
-app = FastAPI(title="STOCHASTIX-TWIN API", version="0.1.0")
+def _timeseries_columns(timeseries: dict[str, np.ndarray]) -> dict[str, list[int]]:
+    """JSON-ready columnar timeseries: one list per series, indexed by day.
+
+    Sending columns instead of one dict per day keeps each key on the wire
+    once, which makes long simulations several times smaller to encode,
+    transfer and parse.
+    """
+
+    return {name: column.tolist() for name, column in timeseries.items()}
+
+
+# Field names per dataclass type, resolved once for `_shallow_asdict`.
+_dataclass_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def _shallow_asdict(obj: Any) -> dict[str, Any]:
+    """One-level `dataclasses.asdict`.
+
+    `asdict` recurses and deep-copies every value, which is wasted work for
+    results that are only serialized to JSON once.
+    """
+
+    names = _dataclass_field_names.get(type(obj))
+    if names is None:
+        names = tuple(f.name for f in fields(obj))
+        _dataclass_field_names[type(obj)] = names
+    return {name: getattr(obj, name) for name in names}
+
+
+def _config_payload(config: SimulationConfig) -> dict[str, Any]:
+    """JSON-ready view of a config (demand peaks are expanded one level)."""
+
+    payload = _shallow_asdict(config)
+    payload["demand_peaks"] = [_shallow_asdict(peak) for peak in config.demand_peaks]
+    return payload
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Stop the job runner (worker pool and progress thread) on shutdown."""
+
+    try:
+        yield
+    finally:
+        _shutdown_job_runner()
+
+
+app = FastAPI(title="STOCHASTIX-TWIN API", version="0.1.0", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -110,9 +172,13 @@ app.add_middleware(
 )
 
 
-_jobs_by_id: dict[str, dict[str, Any]] = {}
+_jobs_by_id: dict[str, JobStatus] = {}
 _jobs_lock = threading.Lock()
 
+# Long-poll waiters per job. Updates come from worker threads, so each waiter is
+# kept with the event loop it must be woken on.
+_job_waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
 
 def _utc_now_iso() -> str:
     """UTC timestamp formatted for JSON."""
@@ -123,12 +189,213 @@ def _utc_now_iso() -> str:
 def _set_job_fields(job_id: str, **fields: Any) -> None:
     """Update job state atomically.
 
-    The lock keeps reads and writes consistent under background execution.
+    The lock only serializes writers. Each update swaps in a new `JobStatus`, and
+    a single dict assignment is atomic, so readers always see a consistent
+    snapshot without locking.
+    """
+
+    with _jobs_lock:
+        job = _jobs_by_id.get(job_id)
+        if job is not None:
+            _jobs_by_id[job_id] = job.model_copy(update=fields)
+            _wake_job_waiters(job_id)
+
+
+def _wake_job_waiters(job_id: str) -> None:
+    """Wake long-poll requests waiting on a job. Call with `_jobs_lock` held."""
+
+    for loop, event in _job_waiters.pop(job_id, ()):
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The waiter's loop has already shut down; nobody is listening.
+            pass
+
+
+def _set_job_progress(job_id: str, progress: float) -> None:
+    """Record progress reported by a worker.
+
+    Progress messages travel through a queue and can land after the job has
+    finished, so only running jobs are updated.
+    """
+
+    with _jobs_lock:
+        job = _jobs_by_id.get(job_id)
+        if job is not None and job.status == "running":
+            _jobs_by_id[job_id] = job.model_copy(update={"progress": progress})
+            _wake_job_waiters(job_id)
+
+
+# One worker process per core. Monte Carlo jobs also run a multi-threaded
+# kernel, so each job is given an even share of the cores for its Numba threads,
+# based on how many jobs are active when it starts: a lone job uses every core,
+# while a full pool runs one thread per job instead of about cores * cores.
+_CPU_COUNT = os.cpu_count() or 1
+
+# Jobs submitted and not yet finished. Guarded by `_jobs_lock`.
+_active_jobs = 0
+
+# Set in each worker process by `_init_worker`; workers report progress here.
+_worker_progress_queue: Optional[multiprocessing.Queue] = None
+
+
+def _init_worker(progress_queue: multiprocessing.Queue) -> None:
+    """Executor initializer: hand the shared progress queue to the worker."""
+
+    global _worker_progress_queue
+    _worker_progress_queue = progress_queue
+
+
+def _run_job_worker(
+    job_id: str,
+    config: SimulationConfig,
+    replications: int,
+    numba_threads: int,
+) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+    """Run one job inside a worker process and return `(payload, error)`.
+
+    This is a top-level function so the executor can pickle it.
     """
 
+    numba.set_num_threads(min(numba_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        if replications == 1:
+            result = run_single(config)
+            payload = {
+                "type": "single",
+                "kpis": _shallow_asdict(result.kpis),
+                "timeseries": _timeseries_columns(result.timeseries),
+                "config": _config_payload(result.config),
+            }
+        else:
+            def progress_callback(progress: float) -> None:
+                if _worker_progress_queue is not None:
+                    _worker_progress_queue.put((job_id, float(progress)))
+
+            monte_carlo_result: MonteCarloResult = monte_carlo(
+                config,
+                replications=replications,
+                progress_cb=progress_callback,
+            )
+            payload = {
+                "type": "monte_carlo",
+                "summary": _shallow_asdict(monte_carlo_result.summary),
+                "config": _config_payload(monte_carlo_result.config),
+            }
+        return payload, None
+    except Exception as exc:
+        # I intentionally surface the message to keep the UI simple.
+        # If this grows, I can switch to structured error types.
+        return None, str(exc)
+
+
+def _finish_job(job_id: str, executor: ProcessPoolExecutor, future: Future) -> None:
+    """Store the outcome of a finished worker future on the job."""
+
+    global _active_jobs
+
     with _jobs_lock:
-        if job_id in _jobs_by_id:
-            _jobs_by_id[job_id].update(fields)
+        _active_jobs -= 1
+
+    try:
+        payload, error = future.result()
+    except Exception as exc:
+        # The worker itself died (e.g. the pool broke); report it like a job error.
+        payload, error = None, str(exc) or type(exc).__name__
+        if isinstance(exc, BrokenProcessPool):
+            # A broken pool rejects every later submit; start a fresh one.
+            _discard_executor(executor)
+
+    if error is None:
+        _set_job_fields(
+            job_id,
+            status="complete",
+            progress=1.0,
+            finished_at=_utc_now_iso(),
+            result=payload,
+        )
+    else:
+        _set_job_fields(
+            job_id,
+            status="error",
+            finished_at=_utc_now_iso(),
+            error=error,
+        )
+
+
+def _drain_progress_queue(progress_queue: multiprocessing.Queue) -> None:
+    """Forward worker progress messages into the job store until `None` arrives."""
+
+    while True:
+        message = progress_queue.get()
+        if message is None:
+            return
+        job_id, progress = message
+        _set_job_progress(job_id, progress)
+
+
+# The job runner (worker pool, progress queue and its drain thread) is started
+# on first use rather than at import. Under the spawn/forkserver start methods
+# every worker re-imports this module, and each would otherwise start its own
+# idle pool and thread.
+_runner_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+_progress_queue: Optional[multiprocessing.Queue] = None
+_progress_thread: Optional[threading.Thread] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the job pool, starting the runner if needed."""
+
+    global _executor, _progress_queue, _progress_thread
+
+    with _runner_lock:
+        if _progress_queue is None:
+            _progress_queue = multiprocessing.Queue()
+            _progress_thread = threading.Thread(
+                target=_drain_progress_queue,
+                args=(_progress_queue,),
+                name="job-progress",
+                daemon=True,
+            )
+            _progress_thread.start()
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=_CPU_COUNT,
+                initializer=_init_worker,
+                initargs=(_progress_queue,),
+            )
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next `_get_executor` call builds a new one."""
+
+    global _executor
+
+    with _runner_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def _shutdown_job_runner() -> None:
+    """Stop the worker pool and the progress thread (app shutdown)."""
+
+    global _executor, _progress_queue, _progress_thread
+
+    with _runner_lock:
+        executor, progress_queue, progress_thread = _executor, _progress_queue, _progress_thread
+        _executor = _progress_queue = _progress_thread = None
+
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+    if progress_queue is not None:
+        progress_queue.put(None)
+        if progress_thread is not None:
+            progress_thread.join()
+        progress_queue.close()
+        progress_queue.join_thread()
 
 
 @app.get("/api/health")
@@ -142,76 +409,87 @@ def health() -> dict[str, str]:
 def start_simulation(request: SimulationRequest) -> JobStatus:
     """Start a background simulation job and return its initial status."""
 
+    global _active_jobs
+
     config = _cfg_from_in(request.config)
     job_id = str(uuid.uuid4())
     created_at = _utc_now_iso()
 
     with _jobs_lock:
-        _jobs_by_id[job_id] = {
-            "job_id": job_id,
-            "status": "running",
-            "progress": 0.0,
-            "created_at": created_at,
-            "finished_at": None,
-            "result": None,
-            "error": None,
-        }
-
-    def run_job() -> None:
-        try:
-            if request.replications == 1:
-                result = run_single(config)
-                payload = {
-                    "type": "single",
-                    "kpis": asdict(result.kpis),
-                    "timeseries": result.timeseries,
-                    "config": asdict(result.config),
-                }
-                _set_job_fields(job_id, progress=1.0)
-            else:
-                def progress_callback(progress: float) -> None:
-                    _set_job_fields(job_id, progress=float(progress))
-
-                monte_carlo_result: MonteCarloResult = monte_carlo(
-                    config,
-                    replications=request.replications,
-                    progress_cb=progress_callback,
-                )
-                payload = {
-                    "type": "monte_carlo",
-                    "summary": asdict(monte_carlo_result.summary),
-                    "config": asdict(monte_carlo_result.config),
-                }
-                _set_job_fields(job_id, progress=1.0)
-
-            _set_job_fields(
-                job_id,
-                status="complete",
-                finished_at=_utc_now_iso(),
-                result=payload,
-            )
-        except Exception as exc:
-            # I intentionally surface the message to keep the UI simple.
-            # If this grows, I can switch to structured error types.
-            _set_job_fields(
-                job_id,
-                status="error",
-                finished_at=_utc_now_iso(),
-                error=str(exc),
-            )
+        _jobs_by_id[job_id] = JobStatus(
+            job_id=job_id,
+            status="running",
+            progress=0.0,
+            created_at=created_at,
+        )
+        _active_jobs += 1
+        numba_threads = max(1, _CPU_COUNT // _active_jobs)
 
-    threading.Thread(target=run_job, daemon=True).start()
+    job_args = (job_id, config, request.replications, numba_threads)
+    executor = _get_executor()
+    try:
+        future = executor.submit(_run_job_worker, *job_args)
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        executor = _get_executor()
+        future = executor.submit(_run_job_worker, *job_args)
+    future.add_done_callback(lambda f: _finish_job(job_id, executor, f))
 
-    with _jobs_lock:
-        return JobStatus(**_jobs_by_id[job_id])
+    return _jobs_by_id[job_id]
+
+
+def _job_has_news(job: JobStatus, last_progress: Optional[float]) -> bool:
+    """Whether a long-poll request should return `job` right away."""
+
+    if job.status != "running":
+        return True
+    return last_progress is not None and job.progress > last_progress
 
 
 @app.get("/api/simulations/{job_id}", response_model=JobStatus)
-def get_simulation(job_id: str) -> JobStatus:
-    """Fetch job status (and result when complete)."""
+async def get_simulation(
+    job_id: str,
+    wait_ms: int = Query(default=0, ge=0, le=30_000),
+    last_progress: Optional[float] = None,
+) -> JobStatus:
+    """Fetch job status (and result when complete).
+
+    With `wait_ms`, this becomes a long-poll: a running job is only returned
+    once its progress moves past `last_progress` (or it changes at all, when
+    `last_progress` is omitted), it finishes, or the wait times out. Clients can
+    then poll far less often without reacting more slowly.
+    """
 
-    with _jobs_lock:
-        job = _jobs_by_id.get(job_id)
-        if job is None:
-            raise HTTPException(status_code=404, detail="job not found")
-        return JobStatus(**job)
+    job = _jobs_by_id.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    if wait_ms == 0 or _job_has_news(job, last_progress):
+        return job
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_ms / 1000
+    while True:
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with _jobs_lock:
+            # Re-check under the lock so an update between the read above and
+            # registering the waiter is not missed.
+            job = _jobs_by_id[job_id]
+            if _job_has_news(job, last_progress):
+                return job
+            _job_waiters.setdefault(job_id, []).append(waiter)
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            with _jobs_lock:
+                waiters = _job_waiters.get(job_id, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    _job_waiters.pop(job_id, None)
+            return _jobs_by_id[job_id]
+
+        job = _jobs_by_id[job_id]
+        if last_progress is None or _job_has_news(job, last_progress):
+            return job
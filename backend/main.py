@@ -6,13 +6,31 @@ as a module import by tools.
 
 from __future__ import annotations
 
+import importlib.util
+
 import uvicorn
 
 
 def main() -> None:
-    """Launch the dev server with reload enabled."""
-
-    uvicorn.run("backend.api.app:app", host="0.0.0.0", port=8000, reload=True)
+    """Launch the dev server with reload enabled.
+
+    uvloop and httptools are picked explicitly (both ship with
+    `uvicorn[standard]`) so the polling endpoint never silently falls back to
+    the slower pure-asyncio stack. uvloop does not support Windows and is not
+    installed there, so the loop falls back to uvicorn's default when it is
+    missing.
+    """
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "auto"
+
+    uvicorn.run(
+        "backend.api.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop=loop,
+        http="httptools",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""Compiled inner loop of the simulation.
+
+The daily loop is scalar bookkeeping on a handful of counters, which is
+exactly what Numba compiles well. The kernel takes pre-sampled randomness and
+plain scalars (no dataclasses, no actors) so it can run as machine code; the
+runner unpacks `SimulationConfig` on the way in and builds results on the way
+out.
+
+The bookkeeping mirrors `Store`, `DistributionCenter` and `order_up_to_sS`. If
+you change the model there, change it here too; `tests/test_kernel.py` runs
+the actors on the same inputs and expects identical results.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+# Length of the run-counter vector `simulate_kernel` returns, in order: demand
+# units, fulfilled units, stockout days, store orders, DC orders, and the
+# running sums of store on-hand, DC on-hand and store backorder.
+N_COUNTERS = 8
+
+
+@numba.njit(cache=True, boundscheck=False)
+def simulate_kernel(
+    days,
+    demands,
+    lead_days,
+    s_store,
+    S_store,
+    s_dc,
+    S_dc,
+    init_store,
+    init_dc,
+    record_series=True,
+):
+    """Simulate `days` daily ticks of the two-echelon (s, S) system.
+
+    `lead_days` holds one whole-day lead time per potential shipment
+    (disruption delays already included) and is consumed in scheduling order.
+    Returns per-day arrays (store on-hand, store backorder, store on-order, DC
+    on-hand, DC on-order) followed by a float64 vector of the `N_COUNTERS` run
+    counters. KPIs are derived from the counters by the runner. With
+    `record_series=False` the per-day arrays are empty and never written, so
+    callers that only need the counters skip those allocations.
+
+    Store backorder is not bounded by the model: while the DC is empty, unmet
+    store orders are booked as backorder and roughly double it each day. It is
+    therefore kept in float64 (as are the order position/quantity derived from
+    it and the running sums), so a diverging run stays monotone instead of
+    wrapping; it only stops being finite past ~1e308. Everything else is bounded
+    by the policy levels and stays int64.
+    """
+
+    # Shipments always arrive at least one day later, so arrivals can be
+    # bucketed per day instead of kept in a heap. Only the next `max_lead` days
+    # can have pending arrivals, so the buckets are a ring buffer indexed by
+    # day modulo its length; a bucket is emptied when its day is processed.
+    # Anything landing after the horizon is never observed (it stays in
+    # on-order), so the ring never needs to be longer than the horizon.
+    ring_len = min(days, lead_days.max() + 1) if days > 0 else 1
+    store_arrivals = np.zeros(ring_len, dtype=np.int64)
+    dc_arrivals = np.zeros(ring_len, dtype=np.int64)
+    shipment_cursor = 0
+
+    series_len = days if record_series else 0
+    store_on_hand = np.empty(series_len, dtype=np.int64)
+    store_backorder = np.empty(series_len, dtype=np.float64)
+    store_on_order = np.empty(series_len, dtype=np.int64)
+    dc_on_hand = np.empty(series_len, dtype=np.int64)
+    dc_on_order = np.empty(series_len, dtype=np.int64)
+
+    store_oh = init_store
+    store_bo = 0.0
+    store_oo = 0
+    dc_oh = init_dc
+    dc_oo = 0
+
+    demand_units = 0
+    fulfilled_units = 0
+    stockout_days = 0
+    orders_store = 0
+    orders_dc = 0
+
+    # KPI averages are accumulated as the loop runs, so the runner does not need
+    # another pass over the per-day arrays.
+    sum_store_on_hand = 0.0
+    sum_dc_on_hand = 0.0
+    sum_store_backorder = 0.0
+
+    for day in range(days):
+        slot = day % ring_len
+        arriving = store_arrivals[slot]
+        if arriving > 0:
+            store_arrivals[slot] = 0
+            store_oo -= arriving
+            # Store.receive: backorders are satisfied first.
+            used = int(min(store_bo, arriving))
+            store_bo -= used
+            store_oh += arriving - used
+
+        arriving = dc_arrivals[slot]
+        if arriving > 0:
+            dc_arrivals[slot] = 0
+            dc_oo -= arriving
+            dc_oh += arriving
+
+        demand = max(0, demands[day])
+        demand_units += demand
+        fulfilled = min(store_oh, demand)
+        store_oh -= fulfilled
+        fulfilled_units += fulfilled
+        unmet = demand - fulfilled
+        if unmet > 0:
+            store_bo += unmet
+            stockout_days += 1
+
+        if store_bo > 0:
+            # Bounded by DC stock, so the shipped amount is back in int64.
+            shipped = int(min(dc_oh, store_bo))
+            dc_oh -= shipped
+            if shipped > 0:
+                store_oo += shipped
+                lead = lead_days[shipment_cursor]
+                shipment_cursor += 1
+                if day + lead < days:
+                    store_arrivals[(day + lead) % ring_len] += shipped
+
+        position = store_oh + store_oo - store_bo
+        quantity = S_store - position if position <= s_store else 0.0
+        if quantity > 0:
+            orders_store += 1
+            shipped = int(min(dc_oh, quantity))
+            dc_oh -= shipped
+            if shipped > 0:
+                store_oo += shipped
+                lead = lead_days[shipment_cursor]
+                shipment_cursor += 1
+                if day + lead < days:
+                    store_arrivals[(day + lead) % ring_len] += shipped
+            if quantity > shipped:
+                store_bo += quantity - shipped
+
+        dc_position = dc_oh + dc_oo
+        dc_quantity = S_dc - dc_position if dc_position <= s_dc else 0
+        if dc_quantity > 0:
+            orders_dc += 1
+            dc_oo += dc_quantity
+            lead = lead_days[shipment_cursor]
+            shipment_cursor += 1
+            if day + lead < days:
+                dc_arrivals[(day + lead) % ring_len] += dc_quantity
+
+        if record_series:
+            store_on_hand[day] = store_oh
+            store_backorder[day] = store_bo
+            store_on_order[day] = store_oo
+            dc_on_hand[day] = dc_oh
+            dc_on_order[day] = dc_oo
+        sum_store_on_hand += store_oh
+        sum_dc_on_hand += dc_oh
+        sum_store_backorder += store_bo
+
+    counters = np.empty(N_COUNTERS, dtype=np.float64)
+    counters[0] = demand_units
+    counters[1] = fulfilled_units
+    counters[2] = stockout_days
+    counters[3] = orders_store
+    counters[4] = orders_dc
+    counters[5] = sum_store_on_hand
+    counters[6] = sum_dc_on_hand
+    counters[7] = sum_store_backorder
+
+    return store_on_hand, store_backorder, store_on_order, dc_on_hand, dc_on_order, counters
+
+
+@numba.njit(cache=True, parallel=True)
+def simulate_batch(
+    days,
+    demands,
+    lead_days,
+    s_store,
+    S_store,
+    s_dc,
+    S_dc,
+    init_store,
+    init_dc,
+):
+    """Run `simulate_kernel` for each row of `demands`/`lead_days` in parallel.
+
+    Rows are independent replications. Returns a (replications, N_COUNTERS)
+    matrix of the run counters, in `simulate_kernel`'s order. Per-day series
+    are not recorded, so replications do not allocate day-length arrays.
+    """
+
+    replications = demands.shape[0]
+    counters = np.empty((replications, N_COUNTERS), dtype=np.float64)
+    for r in numba.prange(replications):
+        result = simulate_kernel(
+            days,
+            demands[r],
+            lead_days[r],
+            s_store,
+            S_store,
+            s_dc,
+            S_dc,
+            init_store,
+            init_dc,
+            False,
+        )
+        counters[r] = result[5]
+    return counters
@@ -1,6 +1,6 @@
 """Simulation actors.
 
-Actors are thin state holders with small methods. The event calendar and timing
-are owned by the SimPy environment in the runner.
+Actors are thin state holders with small methods. They document the per-node
+bookkeeping that the compiled runner kernel (`_kernel.py`) mirrors.
 """
 
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-import simpy
-
 from backend.simulation.actors.base import InventoryState
 
 
@@ -17,7 +15,6 @@ from backend.simulation.actors.base import InventoryState
 class DistributionCenter:
     """A single-echelon distribution center."""
 
-    env: simpy.Environment
     name: str
     inventory: InventoryState
 
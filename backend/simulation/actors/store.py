@@ -7,8 +7,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-import simpy
-
 from backend.simulation.actors.base import InventoryState
 
 
@@ -16,7 +14,6 @@ from backend.simulation.actors.base import InventoryState
 class Store:
     """A retail location consuming demand and receiving replenishments."""
 
-    env: simpy.Environment
     name: str
     inventory: InventoryState
 
@@ -9,6 +9,15 @@ from __future__ import annotations
 import numpy as np
 
 
+def validate_disruption(probability_per_shipment: float, delay_days: float) -> None:
+    """Check disruption parameters (shared by the samplers and the runner)."""
+
+    if probability_per_shipment < 0 or probability_per_shipment > 1:
+        raise ValueError("disruption_probability_per_shipment must be in [0,1]")
+    if delay_days < 0:
+        raise ValueError("disruption_delay_days must be >= 0")
+
+
 def disruption_delay(
     rng: np.random.Generator,
     probability_per_shipment: float,
@@ -21,12 +30,30 @@ def disruption_delay(
     distribution without changing the runner’s call sites.
     """
 
-    if probability_per_shipment < 0 or probability_per_shipment > 1:
-        raise ValueError("disruption_probability_per_shipment must be in [0,1]")
-    if delay_days < 0:
-        raise ValueError("disruption_delay_days must be >= 0")
+    validate_disruption(probability_per_shipment, delay_days)
 
     if probability_per_shipment == 0 or delay_days == 0:
         return 0.0
 
     return float(delay_days if rng.random() < probability_per_shipment else 0.0)
+
+
+def disruption_delays(
+    rng: np.random.Generator,
+    probability_per_shipment: float,
+    delay_days: float,
+    size: int,
+) -> np.ndarray:
+    """Batched `disruption_delay`: one extra-delay value per future shipment.
+
+    The whole Bernoulli mask is drawn in one call, so the runner pays for the
+    disruption toggle once per run instead of once per shipment.
+    """
+
+    validate_disruption(probability_per_shipment, delay_days)
+
+    if probability_per_shipment == 0 or delay_days == 0:
+        return np.zeros(size)
+
+    mask = rng.random(size=size) < probability_per_shipment
+    return np.where(mask, float(delay_days), 0.0)
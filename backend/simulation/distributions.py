@@ -5,6 +5,7 @@ These wrappers centralize validation and keep the core runner readable.
 
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import Optional
@@ -20,11 +21,14 @@ def poisson_demand(rng: np.random.Generator, lam: float) -> int:
     return int(rng.poisson(lam=lam))
 
 
+@functools.lru_cache(maxsize=128)
 def _lognormal_mu_sigma_from_mean_std(mean: float, std: float) -> tuple[float, float]:
     """Convert mean/std of a lognormal into the underlying normal (mu, sigma).
 
     Why this exists: domain users tend to reason in “mean lead time” and
     “variability”, while NumPy needs the parameters of the underlying normal.
+    The conversion is pure and a run only ever uses one (mean, std) pair, so
+    it is memoized.
     """
 
     if mean <= 0:
@@ -51,3 +55,31 @@ def lognormal_days(rng: np.random.Generator, mean_days: float, std_days: float)
     if sigma == 0.0:
         return float(mean_days)
     return float(rng.lognormal(mean=mu, sigma=sigma))
+
+
+def poisson_demand_series(rng: np.random.Generator, lam: np.ndarray) -> np.ndarray:
+    """Sample a full demand path, one Poisson draw per entry of `lam`.
+
+    This is the batched counterpart of `poisson_demand`: the runner knows every
+    day's rate up front, so drawing them in a single call avoids one
+    Python↔NumPy round-trip per simulated day.
+    """
+
+    lam = np.asarray(lam, dtype=float)
+    if lam.size and float(lam.min()) < 0:
+        raise ValueError("demand lambda must be >= 0")
+    return rng.poisson(lam=lam).astype(np.int64)
+
+
+def lognormal_days_batch(
+    rng: np.random.Generator,
+    mean_days: float,
+    std_days: float,
+    size: int,
+) -> np.ndarray:
+    """Sample `size` lead times at once (see `lognormal_days`)."""
+
+    mu, sigma = _lognormal_mu_sigma_from_mean_std(mean_days, std_days)
+    if sigma == 0.0:
+        return np.full(size, float(mean_days))
+    return rng.lognormal(mean=mu, sigma=sigma, size=size)
@@ -1,6 +1,6 @@
 """Business logic building blocks.
 
 This module contains small, testable functions (e.g., inventory policies)
-decoupled from SimPy and actor objects.
+decoupled from the runner and actor objects.
 """
 
@@ -1,12 +1,19 @@
 """Inventory policies.
 
 Policies live in a separate module to keep them easy to test and swap without
-touching the SimPy runner.
+touching the runner.
 """
 
 from __future__ import annotations
 
 
+def validate_sS(s: int, S: int) -> None:
+    """Reject (s, S) parameters that cannot describe an order-up-to policy."""
+
+    if s > S:
+        raise ValueError("Policy requires s <= S")
+
+
 def order_up_to_sS(inventory_position: int, s: int, S: int) -> int:
     """(s, S) order-up-to policy.
 
@@ -14,8 +21,7 @@ def order_up_to_sS(inventory_position: int, s: int, S: int) -> int:
     defined as on-hand + on-order - backorder.
     """
 
-    if s > S:
-        raise ValueError("Policy requires s <= S")
+    validate_sS(s, S)
     if inventory_position <= s:
         return max(0, S - inventory_position)
     return 0
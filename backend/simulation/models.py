@@ -9,8 +9,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DemandPeak:
     """A temporary multiplier applied to baseline demand.
 
@@ -23,7 +25,7 @@ class DemandPeak:
     multiplier: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Inputs controlling a single simulation run.
 
@@ -54,8 +56,14 @@ class SimulationConfig:
 
     seed: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        # Accept any iterable of peaks but store a tuple, so configs stay
+        # hashable (seeded results are cached by config).
+        if not isinstance(self.demand_peaks, tuple):
+            object.__setattr__(self, "demand_peaks", tuple(self.demand_peaks))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class KPIs:
     """KPIs computed from a completed run."""
 
@@ -73,20 +81,31 @@ class KPIs:
 
 @dataclass(frozen=True)
 class SimulationResult:
-    """Result of a single simulation run."""
+    """Result of a single simulation run.
+
+    `timeseries` maps each series name (`day`, `store_on_hand`, ...) to an
+    array with one entry per simulated day. Series are integer-valued; store
+    backorder is float64 because it is unbounded in diverging scenarios.
+    """
 
     config: SimulationConfig
     kpis: KPIs
-    timeseries: List[Dict[str, Any]]
+    timeseries: Dict[str, np.ndarray]
 
 
 @dataclass(frozen=True)
 class MonteCarloSummary:
-    """Aggregate statistics across multiple replications."""
+    """Aggregate statistics across multiple replications.
+
+    `kpi_p05` / `kpi_p95` are the 5th and 95th percentiles of each KPI across
+    replications, for uncertainty bands.
+    """
 
     replications: int
     kpi_mean: Dict[str, float]
     kpi_std: Dict[str, float]
+    kpi_p05: Dict[str, float] = field(default_factory=dict)
+    kpi_p95: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
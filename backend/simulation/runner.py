@@ -1,179 +1,282 @@
 """Simulation runner.
 
-The runner owns the SimPy environment and orchestrates daily decisions.
-Keeping orchestration here (instead of spreading it across many actor methods)
-makes it easier to audit and to keep deterministic behavior under seeding.
+The runner samples all randomness, hands the day-stepped loop to the compiled
+kernel in `_kernel.py`, and turns its raw arrays into results. Keeping
+orchestration here (instead of spreading it across many actor methods) makes it
+easier to audit and to keep deterministic behavior under seeding.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, replace
-from typing import Callable, Dict, List, Optional, Protocol
+import functools
+import math
+from dataclasses import replace
+from typing import Callable, Dict, Optional
 
+import numba
 import numpy as np
-import simpy
-
-from backend.simulation.actors.base import InventoryState
-from backend.simulation.actors.distribution_center import DistributionCenter
-from backend.simulation.actors.store import Store
-from backend.simulation.chaos.events import disruption_delay
-from backend.simulation.distributions import lognormal_days, poisson_demand
-from backend.simulation.logic.policy import order_up_to_sS
-from backend.simulation.models import KPIs, MonteCarloResult, MonteCarloSummary, SimulationConfig, SimulationResult
 
+from backend.simulation._kernel import N_COUNTERS, simulate_batch, simulate_kernel
+from backend.simulation.chaos.events import disruption_delays, validate_disruption
+from backend.simulation.distributions import lognormal_days_batch, poisson_demand_series
+from backend.simulation.logic.policy import validate_sS
+from backend.simulation.models import KPIs, MonteCarloResult, MonteCarloSummary, SimulationConfig, SimulationResult
 
-class _Receivable(Protocol):
-    """Duck-typed interface for any node that can receive a shipment."""
 
-    inventory: InventoryState
+# Upper bound on shipments scheduled per simulated day: a store backorder
+# catch-up, a store replenishment and a DC replenishment.
+_MAX_SHIPMENTS_PER_DAY = 3
+
+# Monte Carlo runs replications in batches of at least this fraction of the
+# run. Progress is reported once per batch, which keeps callbacks (and the
+# caller's locking) to about a hundred per run.
+_PROGRESS_STEP = 0.01
+
+# Column layout of the per-replication KPI table; mirrors the `KPIs` fields.
+_KPI_DTYPE = np.dtype(
+    [
+        ("service_level", np.float64),
+        ("fill_rate", np.float64),
+        ("demand_units", np.int64),
+        ("fulfilled_units", np.int64),
+        ("stockout_days", np.int64),
+        ("avg_on_hand_store", np.float64),
+        ("avg_on_hand_dc", np.float64),
+        ("avg_backorder_store", np.float64),
+        ("total_orders_store", np.int64),
+        ("total_orders_dc", np.int64),
+    ]
+)
+
+
+def _build_demand_multipliers(config: SimulationConfig) -> np.ndarray:
+    """Per-day multiplicative demand factors from `config.demand_peaks`.
+
+    Peaks are inclusive of `end_day` and compound where they overlap.
+    """
 
-    def receive(self, quantity: int) -> None: ...
+    multipliers = np.ones(config.days)
+    for peak in config.demand_peaks:
+        # Clamp explicitly: raw negative bounds would slice from the end.
+        start = max(peak.start_day, 0)
+        end = min(peak.end_day + 1, config.days)
+        if end > start:
+            multipliers[start:end] *= float(peak.multiplier)
+    return multipliers
 
 
-def _demand_multiplier_for_day(config: SimulationConfig, day: int) -> float:
-    """Compute the multiplicative demand factor for a given day."""
+def _validate_config(config: SimulationConfig) -> None:
+    """Parameter checks run once per config, before any sampling."""
 
-    multiplier = 1.0
-    for peak in config.demand_peaks:
-        if peak.start_day <= day <= peak.end_day:
-            multiplier *= float(peak.multiplier)
-    return multiplier
+    validate_sS(config.s_store, config.S_store)
+    validate_sS(config.s_dc, config.S_dc)
+    validate_disruption(config.disruption_probability_per_shipment, config.disruption_delay_days)
 
 
-def run_single(config: SimulationConfig) -> SimulationResult:
-    """Run a single stochastic replication.
+def _sample_replication_inputs(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    demand_lambdas: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draw one replication's demand path and whole-day lead-time pool.
 
-    The returned `timeseries` is designed for lightweight dashboards: each entry
-    is a dict of numeric values that can be plotted without additional decoding.
+    All stochastic inputs are drawn up front in batched calls; the kernel only
+    reads them back through integer cursors.
     """
 
-    random_generator = np.random.default_rng(config.seed)
-    environment = simpy.Environment()
+    daily_demands = poisson_demand_series(rng, demand_lambdas)
 
-    distribution_center = DistributionCenter(
-        env=environment,
-        name="DC",
-        inventory=InventoryState(on_hand=config.initial_on_hand_dc),
+    max_shipments = _MAX_SHIPMENTS_PER_DAY * config.days
+    lead_times = lognormal_days_batch(
+        rng,
+        config.lead_time_mean_days,
+        config.lead_time_std_days,
+        max_shipments,
     )
-    store = Store(
-        env=environment,
-        name="Store",
-        inventory=InventoryState(on_hand=config.initial_on_hand_store),
+    # Disruptions are off in most scenarios; skip the draw entirely then. The
+    # parameters were already validated once per config by the caller.
+    disruption_enabled = (
+        config.disruption_probability_per_shipment != 0 and config.disruption_delay_days != 0
     )
+    if disruption_enabled:
+        lead_times += disruption_delays(
+            rng,
+            config.disruption_probability_per_shipment,
+            config.disruption_delay_days,
+            max_shipments,
+        )
 
-    timeseries: List[Dict[str, float]] = []
+    if not np.isfinite(lead_times).all():
+        raise ValueError("Lead-time settings produced non-finite lead times")
 
-    def schedule_inbound_shipment(receiver: _Receivable, quantity: int) -> None:
-        """Schedule an arrival event and track pipeline inventory.
+    # Only the arrival day matters to the day-stepped kernel, so lead times are
+    # rounded up to whole days once here rather than per shipment. Anything
+    # arriving on or after `days` never lands, so clipping there keeps huge
+    # lead times from wrapping in the int64 cast without changing results.
+    return daily_demands, np.minimum(np.ceil(lead_times), config.days).astype(np.int64)
 
-        I track `on_order` so inventory position includes pipeline stock.
-        Without that, the (s, S) policy tends to over-order and inflate
-        variability.
-        """
 
-        if quantity <= 0:
-            return
+def _policy_args(config: SimulationConfig) -> tuple[int, ...]:
+    """Scalar policy/initial-state arguments shared by both kernels."""
 
-        receiver.inventory.on_order += quantity
+    return (
+        int(config.s_store),
+        int(config.S_store),
+        int(config.s_dc),
+        int(config.S_dc),
+        int(config.initial_on_hand_store),
+        int(config.initial_on_hand_dc),
+    )
 
-        lead_time_days = lognormal_days(
-            random_generator,
-            config.lead_time_mean_days,
-            config.lead_time_std_days,
-        )
-        lead_time_days += disruption_delay(
-            random_generator,
-            config.disruption_probability_per_shipment,
-            config.disruption_delay_days,
+
+def _check_finite(counters: np.ndarray) -> None:
+    """Reject runs whose store backorder grew past the float64 range."""
+
+    if not np.isfinite(counters).all():
+        raise ValueError(
+            "Simulation diverged beyond the representable range "
+            "(store backorders grow without bound for this configuration)"
         )
 
-        def arrival_process() -> simpy.events.Event:
-            yield environment.timeout(lead_time_days)
-            receiver.inventory.on_order -= quantity
-            receiver.receive(quantity)
-
-        environment.process(arrival_process())
-
-    def daily_process() -> simpy.events.Event:
-        for day in range(config.days):
-            demand_lambda = config.demand_lambda_per_day * _demand_multiplier_for_day(config, day)
-            store.consume_demand(poisson_demand(random_generator, demand_lambda))
-
-            if store.inventory.backorder > 0:
-                # I prioritize clearing accumulated backorders before placing a new order-up-to,
-                # which keeps the behavior closer to "ship what you owe" operations.
-                shipped_quantity = distribution_center.ship_to_store(store.inventory.backorder)
-                if shipped_quantity > 0:
-                    schedule_inbound_shipment(store, shipped_quantity)
-
-            store_inventory_position = store.inventory.inventory_position()
-            store_replenishment_quantity = order_up_to_sS(
-                store_inventory_position,
-                config.s_store,
-                config.S_store,
-            )
-            if store_replenishment_quantity > 0:
-                store.orders_placed += 1
-                shipped_quantity = distribution_center.ship_to_store(store_replenishment_quantity)
-                if shipped_quantity > 0:
-                    schedule_inbound_shipment(store, shipped_quantity)
-
-                unshipped_quantity = store_replenishment_quantity - shipped_quantity
-                if unshipped_quantity > 0:
-                    store.inventory.backorder += unshipped_quantity
-
-            dc_inventory_position = distribution_center.inventory.inventory_position()
-            dc_replenishment_quantity = order_up_to_sS(
-                dc_inventory_position,
-                config.s_dc,
-                config.S_dc,
-            )
-            if dc_replenishment_quantity > 0:
-                distribution_center.orders_placed += 1
-                schedule_inbound_shipment(distribution_center, dc_replenishment_quantity)
-
-            timeseries.append(
-                {
-                    "day": float(day),
-                    "store_on_hand": float(store.inventory.on_hand),
-                    "store_backorder": float(store.inventory.backorder),
-                    "store_on_order": float(store.inventory.on_order),
-                    "dc_on_hand": float(distribution_center.inventory.on_hand),
-                    "dc_on_order": float(distribution_center.inventory.on_order),
-                }
-            )
-
-            yield environment.timeout(1.0)
-
-    environment.process(daily_process())
-    environment.run(until=float(config.days))
-
-    demand_units = int(store.demand_units)
-    fulfilled_units = int(store.fulfilled_units)
-
-    service_level = 1.0 - (store.stockout_days / config.days if config.days > 0 else 0.0)
-    fill_rate = (fulfilled_units / demand_units) if demand_units > 0 else 1.0
-
-    avg_on_hand_store = float(np.mean([p["store_on_hand"] for p in timeseries])) if timeseries else 0.0
-    avg_on_hand_dc = float(np.mean([p["dc_on_hand"] for p in timeseries])) if timeseries else 0.0
-    avg_backorder_store = float(np.mean([p["store_backorder"] for p in timeseries])) if timeseries else 0.0
-
-    kpis = KPIs(
-        service_level=float(service_level),
-        fill_rate=float(fill_rate),
-        demand_units=demand_units,
-        fulfilled_units=fulfilled_units,
-        stockout_days=int(store.stockout_days),
-        avg_on_hand_store=avg_on_hand_store,
-        avg_on_hand_dc=avg_on_hand_dc,
-        avg_backorder_store=avg_backorder_store,
-        total_orders_store=int(store.orders_placed),
-        total_orders_dc=int(distribution_center.orders_placed),
+
+def _kpi_table(config: SimulationConfig, counters: np.ndarray) -> np.ndarray:
+    """Turn kernel run counters (one row per replication) into a KPI table.
+
+    The result is a structured array with one column per `KPIs` field, named
+    after it, so KPIs are computed column-wise and a row maps onto the
+    dataclass by name.
+    """
+
+    (
+        demand_units,
+        fulfilled_units,
+        stockout_days,
+        total_orders_store,
+        total_orders_dc,
+        sum_store_on_hand,
+        sum_dc_on_hand,
+        sum_store_backorder,
+    ) = counters.T
+    days = config.days
+
+    table = np.empty(counters.shape[0], dtype=_KPI_DTYPE)
+    table["service_level"] = 1.0 - (stockout_days / days if days > 0 else 0.0)
+    table["fill_rate"] = np.divide(
+        fulfilled_units,
+        demand_units,
+        out=np.ones(counters.shape[0]),
+        where=demand_units > 0,
     )
+    table["demand_units"] = demand_units
+    table["fulfilled_units"] = fulfilled_units
+    table["stockout_days"] = stockout_days
+    table["avg_on_hand_store"] = sum_store_on_hand / days if days > 0 else 0.0
+    table["avg_on_hand_dc"] = sum_dc_on_hand / days if days > 0 else 0.0
+    table["avg_backorder_store"] = sum_store_backorder / days if days > 0 else 0.0
+    table["total_orders_store"] = total_orders_store
+    table["total_orders_dc"] = total_orders_dc
+    return table
+
+
+def run_single(
+    config: SimulationConfig,
+    *,
+    rng: Optional[np.random.Generator] = None,
+    demand_lambdas: Optional[np.ndarray] = None,
+) -> SimulationResult:
+    """Run a single stochastic replication.
+
+    The returned `timeseries` is columnar: one array per series, indexed by day.
+    Dashboards that want one dict per day can zip the columns at the edge.
+
+    `rng` defaults to `default_rng(config.seed)`. `demand_lambdas` lets callers
+    that already built the per-day Poisson rates for this config pass them in.
 
+    A seeded run is fully determined by its config, so those results are
+    cached. Callers always get their own (writable) timeseries arrays.
+    """
+
+    if rng is None and demand_lambdas is None and config.seed is not None:
+        cached = _run_single_cached(config)
+        timeseries = {name: column.copy() for name, column in cached.timeseries.items()}
+        return replace(cached, timeseries=timeseries)
+
+    random_generator = np.random.default_rng(config.seed) if rng is None else rng
+    return _simulate_single(config, random_generator, demand_lambdas)
+
+
+@functools.lru_cache(maxsize=128)
+def _run_single_cached(config: SimulationConfig) -> SimulationResult:
+    """Seeded `run_single`, memoized on the (hashable, frozen) config.
+
+    The cached arrays are made read-only so the shared copy cannot be changed.
+    """
+
+    result = _simulate_single(config, np.random.default_rng(config.seed), None)
+    for column in result.timeseries.values():
+        column.flags.writeable = False
+    return result
+
+
+def _simulate_single(
+    config: SimulationConfig,
+    random_generator: np.random.Generator,
+    demand_lambdas: Optional[np.ndarray],
+) -> SimulationResult:
+    """Sample inputs for one replication, run the kernel and build the result."""
+
+    _validate_config(config)
+
+    if demand_lambdas is None:
+        demand_lambdas = config.demand_lambda_per_day * _build_demand_multipliers(config)
+    daily_demands, lead_days = _sample_replication_inputs(config, random_generator, demand_lambdas)
+
+    (
+        store_on_hand,
+        store_backorder,
+        store_on_order,
+        dc_on_hand,
+        dc_on_order,
+        counters,
+    ) = simulate_kernel(config.days, daily_demands, lead_days, *_policy_args(config))
+    _check_finite(counters)
+
+    timeseries: Dict[str, np.ndarray] = {
+        "day": np.arange(config.days),
+        "store_on_hand": store_on_hand,
+        "store_backorder": store_backorder,
+        "store_on_order": store_on_order,
+        "dc_on_hand": dc_on_hand,
+        "dc_on_order": dc_on_order,
+    }
+
+    table = _kpi_table(config, counters[np.newaxis])
+    kpis = KPIs(**dict(zip(table.dtype.names, table[0].tolist())))
     return SimulationResult(config=config, kpis=kpis, timeseries=timeseries)
 
 
+def _replication_seeds(seed: Optional[int], replications: int) -> tuple[np.random.SeedSequence, ...]:
+    """Per-replication child seeds of `SeedSequence(seed)`.
+
+    Spawning thousands of children costs about as much as a small batch of
+    replications, and seeded runs get re-requested with the same settings, so
+    seeded spawns are memoized. A fresh parent is spawned from every time: a
+    `SeedSequence` counts the children it has handed out, so spawning twice
+    from one cached parent would give a different set of streams.
+    """
+
+    if seed is None:
+        return tuple(np.random.SeedSequence().spawn(replications))
+    return _spawn_seeded(seed, replications)
+
+
+@functools.lru_cache(maxsize=16)
+def _spawn_seeded(seed: int, replications: int) -> tuple[np.random.SeedSequence, ...]:
+    """Memoized spawn for `_replication_seeds` (seeded runs only)."""
+
+    return tuple(np.random.SeedSequence(seed).spawn(replications))
+
+
 def monte_carlo(
     config: SimulationConfig,
     replications: int,
@@ -181,26 +284,58 @@ def monte_carlo(
 ) -> MonteCarloResult:
     """Run multiple replications and summarize KPI uncertainty.
 
-    I derive per-replication seeds by offsetting the base seed. This preserves
-    repeatability while still producing distinct trajectories.
+    Each replication gets its own child of `SeedSequence(config.seed)`. Spawned
+    streams are statistically independent (unlike seeds `seed, seed + 1, ...`)
+    while the whole run stays repeatable for a given base seed.
     """
 
     if replications <= 0:
         raise ValueError("replications must be > 0")
 
-    samples: List[KPIs] = []
-    for i in range(replications):
-        seed = None if config.seed is None else int(config.seed) + i
-        result = run_single(replace(config, seed=seed))
-        samples.append(result.kpis)
-        if progress_cb is not None:
-            progress_cb((i + 1) / replications)
+    _validate_config(config)
+
+    replication_seeds = _replication_seeds(config.seed, replications)
+    demand_lambdas = config.demand_lambda_per_day * _build_demand_multipliers(config)
+    policy_args = _policy_args(config)
 
-    kpi_fields = list(asdict(samples[0]).keys()) if samples else []
-    matrix = {field: np.array([getattr(k, field) for k in samples], dtype=float) for field in kpi_fields}
+    # Replications are stacked into (batch, days) input matrices and simulated
+    # by one parallel kernel call per batch. Each row is drawn from that
+    # replication's own stream, so a sample equals `run_single` on the same
+    # stream. Batches also bound memory for long horizons.
+    batch_size = max(numba.get_num_threads(), math.ceil(replications * _PROGRESS_STEP))
 
-    kpi_mean = {k: float(np.mean(v)) for k, v in matrix.items()}
-    kpi_std = {k: float(np.std(v, ddof=1)) if replications > 1 else 0.0 for k, v in matrix.items()}
+    counters = np.empty((replications, N_COUNTERS), dtype=np.float64)
+    for batch_start in range(0, replications, batch_size):
+        batch_seeds = replication_seeds[batch_start : batch_start + batch_size]
+        inputs = [
+            _sample_replication_inputs(config, np.random.default_rng(seed), demand_lambdas)
+            for seed in batch_seeds
+        ]
+        demands = np.stack([daily_demands for daily_demands, _ in inputs])
+        lead_days = np.stack([replication_lead_days for _, replication_lead_days in inputs])
 
-    summary = MonteCarloSummary(replications=replications, kpi_mean=kpi_mean, kpi_std=kpi_std)
+        batch_end = batch_start + len(batch_seeds)
+        counters[batch_start:batch_end] = simulate_batch(config.days, demands, lead_days, *policy_args)
+        _check_finite(counters[batch_start:batch_end])
+
+        if progress_cb is not None:
+            progress_cb(batch_end / replications)
+
+    # Summary statistics are column reductions over the KPI table rather than
+    # Python loops over per-replication dataclasses.
+    kpis = _kpi_table(config, counters)
+    names = kpis.dtype.names
+    kpi_mean = {name: float(kpis[name].mean()) for name in names}
+    kpi_std = {name: float(kpis[name].std(ddof=1)) if replications > 1 else 0.0 for name in names}
+    kpi_p05 = {name: float(np.quantile(kpis[name], 0.05)) for name in names}
+    kpi_p95 = {name: float(np.quantile(kpis[name], 0.95)) for name in names}
+
+    samples = [KPIs(**dict(zip(names, row))) for row in kpis.tolist()]
+    summary = MonteCarloSummary(
+        replications=replications,
+        kpi_mean=kpi_mean,
+        kpi_std=kpi_std,
+        kpi_p05=kpi_p05,
+        kpi_p95=kpi_p95,
+    )
     return MonteCarloResult(config=config, summary=summary, samples=samples)
@@ -103,8 +103,9 @@ export default function App() {
   const singleTimeseries = result?.type === 'single' ? result.timeseries : null
 
   const chartSeries = useMemo(() => {
-    if (!singleTimeseries?.length) return null
-    const points = (key) => singleTimeseries.map((p) => ({ x: p.day, y: p[key] }))
+    // The API sends the timeseries as columns: `day` plus one array per series.
+    if (!singleTimeseries?.day?.length) return null
+    const points = (key) => singleTimeseries.day.map((day, i) => ({ x: day, y: singleTimeseries[key][i] }))
     return [
       { name: 'Store on-hand', color: '#2563eb', points: points('store_on_hand') },
       { name: 'Store backorder', color: '#dc2626', points: points('store_backorder') },
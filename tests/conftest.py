@@ -7,6 +7,24 @@ These tests run without packaging the project. Adding the repo root to
 import sys
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_numba():
+    """Compile the simulation kernels once, before any test runs.
+
+    Otherwise whichever test happens to run first pays the JIT cost (or the
+    on-disk cache load), which skews its timing.
+    """
+
+    from backend.simulation.models import SimulationConfig
+    from backend.simulation.runner import monte_carlo, run_single
+
+    config = SimulationConfig(days=2, demand_lambda_per_day=1, seed=0)
+    run_single(config)
+    monte_carlo(config, replications=1)
@@ -5,10 +5,13 @@ and avoids any dependence on ports or external services.
 """
 
 import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 
 import httpx
 import pytest
 
+from backend.api import app as app_module
 from backend.api.app import app
 
 
@@ -64,6 +67,71 @@ async def test_api_simulation_single_completes():
         assert last["status"] == "complete"
         assert last["result"]["type"] == "single"
         assert "kpis" in last["result"]
+        timeseries = last["result"]["timeseries"]
+        assert timeseries["day"] == list(range(30))
+        assert len(timeseries["store_on_hand"]) == 30
+
+
+@pytest.mark.anyio
+async def test_api_long_poll_returns_when_job_finishes():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        payload = {
+            "config": {
+                "days": 60,
+                "demand_lambda_per_day": 15,
+                "demand_peaks": [],
+                "s_store": 80,
+                "S_store": 160,
+                "s_dc": 200,
+                "S_dc": 400,
+                "initial_on_hand_store": 120,
+                "initial_on_hand_dc": 300,
+                "lead_time_mean_days": 7,
+                "lead_time_std_days": 2,
+                "disruption_probability_per_shipment": 0,
+                "disruption_delay_days": 0,
+                "seed": 7,
+            },
+            "replications": 5,
+        }
+
+        start = await client.post("/api/simulations", json=payload)
+        job_id = start.json()["job_id"]
+
+        last = start.json()
+        polls = 0
+        while last["status"] == "running" and polls < 20:
+            res = await client.get(
+                f"/api/simulations/{job_id}",
+                params={"wait_ms": 2000, "last_progress": last["progress"]},
+            )
+            assert res.status_code == 200
+            last = res.json()
+            polls += 1
+
+        assert last["status"] == "complete"
+        assert last["result"]["type"] == "monte_carlo"
+
+
+def test_broken_worker_pool_is_replaced():
+    executor = app_module._get_executor()
+    job_id = "broken-pool-job"
+    with app_module._jobs_lock:
+        app_module._jobs_by_id[job_id] = app_module.JobStatus(
+            job_id=job_id,
+            status="running",
+            progress=0.0,
+            created_at=app_module._utc_now_iso(),
+        )
+        app_module._active_jobs += 1
+
+    future: Future = Future()
+    future.set_exception(BrokenProcessPool("a worker died"))
+    app_module._finish_job(job_id, executor, future)
+
+    assert app_module._jobs_by_id[job_id].status == "error"
+    assert app_module._get_executor() is not executor
 
 
 async def _sleep(seconds: float) -> None:
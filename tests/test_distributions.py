@@ -5,8 +5,9 @@ parameterization mistakes.
 """
 
 import numpy as np
+import pytest
 
-from backend.simulation.distributions import lognormal_days, poisson_demand
+from backend.simulation.distributions import lognormal_days, poisson_demand, poisson_demand_series
 
 
 def test_poisson_demand_mean_approx():
@@ -34,3 +35,19 @@ def test_lognormal_days_non_negative():
     rng = np.random.default_rng(1)
     for _ in range(1000):
         assert lognormal_days(rng, 3.0, 1.0) >= 0.0
+
+
+def test_poisson_demand_series_tracks_per_day_lambda():
+    rng = np.random.default_rng(123)
+    lam = np.repeat([5.0, 40.0], 10_000)
+    samples = poisson_demand_series(rng, lam)
+
+    assert samples.shape == lam.shape
+    assert abs(float(samples[:10_000].mean()) - 5.0) / 5.0 < 0.05
+    assert abs(float(samples[10_000:].mean()) - 40.0) / 40.0 < 0.05
+
+
+def test_poisson_demand_series_guard_negative():
+    rng = np.random.default_rng(1)
+    with pytest.raises(ValueError):
+        poisson_demand_series(rng, np.array([1.0, -0.5]))
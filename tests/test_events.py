@@ -0,0 +1,26 @@
+"""Sanity checks for disruption sampling."""
+
+import numpy as np
+import pytest
+
+from backend.simulation.chaos.events import disruption_delays
+
+
+def test_disruption_delays_bernoulli_frequency():
+    rng = np.random.default_rng(5)
+    delays = disruption_delays(rng, probability_per_shipment=0.25, delay_days=3.0, size=20_000)
+
+    assert set(np.unique(delays).tolist()) <= {0.0, 3.0}
+    assert abs(float((delays > 0).mean()) - 0.25) < 0.02
+
+
+def test_disruption_delays_disabled_is_zero():
+    rng = np.random.default_rng(5)
+    assert not disruption_delays(rng, 0.0, 3.0, size=10).any()
+    assert not disruption_delays(rng, 0.5, 0.0, size=10).any()
+
+
+def test_disruption_delays_guard_invalid():
+    rng = np.random.default_rng(5)
+    with pytest.raises(ValueError):
+        disruption_delays(rng, 1.5, 1.0, size=1)
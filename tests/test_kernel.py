@@ -0,0 +1,103 @@
+"""Parity between the compiled kernel and the reference actors.
+
+The kernel re-implements `Store`, `DistributionCenter` and `order_up_to_sS` as
+scalar bookkeeping. These tests drive the actors directly on the same
+pre-sampled demand and lead-time arrays and expect identical results.
+"""
+
+import numpy as np
+import pytest
+
+from backend.simulation._kernel import simulate_kernel
+from backend.simulation.actors.base import InventoryState
+from backend.simulation.actors.distribution_center import DistributionCenter
+from backend.simulation.actors.store import Store
+from backend.simulation.logic.policy import order_up_to_sS
+from backend.simulation.models import SimulationConfig
+from backend.simulation.runner import _build_demand_multipliers, _policy_args, _sample_replication_inputs
+
+
+def _reference_run(config, demands, lead_days):
+    """Day-stepped run of the actor model, in the kernel's event order."""
+
+    store = Store(name="Store", inventory=InventoryState(on_hand=config.initial_on_hand_store))
+    dc = DistributionCenter(name="DC", inventory=InventoryState(on_hand=config.initial_on_hand_dc))
+    arrivals = {}
+    leads = iter(lead_days.tolist())
+
+    def schedule(receiver, quantity, day):
+        receiver.inventory.on_order += quantity
+        arrivals.setdefault(day + next(leads), []).append((receiver, quantity))
+
+    series = {name: [] for name in ("store_on_hand", "store_backorder", "store_on_order", "dc_on_hand", "dc_on_order")}
+    sums = [0, 0, 0]
+    for day in range(config.days):
+        for receiver, quantity in arrivals.pop(day, []):
+            receiver.inventory.on_order -= quantity
+            receiver.receive(quantity)
+
+        store.consume_demand(int(demands[day]))
+
+        if store.inventory.backorder > 0:
+            shipped = dc.ship_to_store(store.inventory.backorder)
+            if shipped > 0:
+                schedule(store, shipped, day)
+
+        quantity = order_up_to_sS(store.inventory.inventory_position(), config.s_store, config.S_store)
+        if quantity > 0:
+            store.orders_placed += 1
+            shipped = dc.ship_to_store(quantity)
+            if shipped > 0:
+                schedule(store, shipped, day)
+            if quantity > shipped:
+                store.inventory.backorder += quantity - shipped
+
+        quantity = order_up_to_sS(dc.inventory.inventory_position(), config.s_dc, config.S_dc)
+        if quantity > 0:
+            dc.orders_placed += 1
+            schedule(dc, quantity, day)
+
+        series["store_on_hand"].append(store.inventory.on_hand)
+        series["store_backorder"].append(store.inventory.backorder)
+        series["store_on_order"].append(store.inventory.on_order)
+        series["dc_on_hand"].append(dc.inventory.on_hand)
+        series["dc_on_order"].append(dc.inventory.on_order)
+        sums[0] += store.inventory.on_hand
+        sums[1] += dc.inventory.on_hand
+        sums[2] += store.inventory.backorder
+
+    counters = [
+        store.demand_units,
+        store.fulfilled_units,
+        store.stockout_days,
+        store.orders_placed,
+        dc.orders_placed,
+        *sums,
+    ]
+    return series, counters
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SimulationConfig(days=120, seed=1),
+        SimulationConfig(days=90, demand_lambda_per_day=15, s_dc=200, S_dc=400, initial_on_hand_dc=300, seed=2),
+        SimulationConfig(
+            days=90,
+            disruption_probability_per_shipment=0.3,
+            disruption_delay_days=4,
+            lead_time_std_days=0,
+            seed=3,
+        ),
+    ],
+)
+def test_kernel_matches_actor_reference(config):
+    demand_lambdas = config.demand_lambda_per_day * _build_demand_multipliers(config)
+    demands, lead_days = _sample_replication_inputs(config, np.random.default_rng(config.seed), demand_lambdas)
+
+    expected_series, expected_counters = _reference_run(config, demands, lead_days)
+    *arrays, counters = simulate_kernel(config.days, demands, lead_days, *_policy_args(config))
+
+    for name, array in zip(expected_series, arrays):
+        assert array.tolist() == expected_series[name], name
+    assert counters.tolist() == expected_counters
@@ -3,8 +3,11 @@
 These tests focus on determinism under seeding and basic output sanity.
 """
 
+import numpy as np
+import pytest
+
 from backend.simulation.models import DemandPeak, SimulationConfig
-from backend.simulation.runner import monte_carlo, run_single
+from backend.simulation.runner import _build_demand_multipliers, _run_single_cached, monte_carlo, run_single
 
 
 def test_run_single_kpis_sane_ranges():
@@ -36,6 +39,80 @@ def test_run_single_deterministic_with_seed():
     assert r1.kpis == r2.kpis
 
 
+def test_run_single_deterministic_without_result_cache():
+    cfg = SimulationConfig(days=30, demand_lambda_per_day=10, seed=321)
+    r1 = run_single(cfg)
+    _run_single_cached.cache_clear()
+    r2 = run_single(cfg)
+    assert r1.kpis == r2.kpis
+    assert r1.timeseries["store_on_hand"].tolist() == r2.timeseries["store_on_hand"].tolist()
+
+
+def test_seeded_run_accepts_list_of_peaks_and_returns_writable_arrays():
+    peaks = [DemandPeak(start_day=2, end_day=5, multiplier=2.0)]
+    cfg = SimulationConfig(days=20, demand_peaks=peaks, seed=7)
+    r = run_single(cfg)
+    assert r.config.demand_peaks == tuple(peaks)
+    assert r.timeseries["store_on_hand"].flags.writeable
+    r.timeseries["store_on_hand"][0] = -1
+    assert run_single(cfg).timeseries["store_on_hand"][0] != -1
+
+
+def test_diverging_backorders_stay_monotone_instead_of_wrapping():
+    # A 60-day lead time leaves the DC empty long enough for store backorders
+    # to compound far past the int64 range.
+    cfg = SimulationConfig(days=365, lead_time_mean_days=60, lead_time_std_days=2, seed=1)
+    r = run_single(cfg)
+    backorder = r.timeseries["store_backorder"]
+    assert np.all(np.diff(backorder) >= 0)
+    assert backorder[-1] > 2.0**63
+    assert r.kpis.service_level < 0.05
+
+
+def test_backorders_past_float_range_raise():
+    cfg = SimulationConfig(days=3650, lead_time_mean_days=60, lead_time_std_days=2, seed=1)
+    with pytest.raises(ValueError):
+        run_single(cfg)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"lead_time_mean_days": 1e20},
+        {"disruption_probability_per_shipment": 1.0, "disruption_delay_days": 1e19},
+    ],
+)
+def test_huge_lead_times_never_deliver(overrides):
+    cfg = SimulationConfig(days=60, seed=1, **overrides)
+    r = run_single(cfg)
+    assert r.timeseries["dc_on_hand"].max() <= cfg.initial_on_hand_dc
+    assert r.timeseries["store_on_hand"].max() <= cfg.initial_on_hand_store
+
+
+def test_non_finite_lead_times_rejected():
+    with pytest.raises(ValueError):
+        run_single(SimulationConfig(days=60, lead_time_std_days=1e200, seed=1))
+
+
+def test_default_config_monte_carlo_completes():
+    mc = monte_carlo(SimulationConfig(seed=123), replications=200)
+    assert all(np.isfinite(v) for v in mc.summary.kpi_mean.values())
+
+
+@pytest.mark.parametrize("probability, delay", [(1.5, 0.0), (0.0, -2.0), (-0.1, 0.0)])
+def test_invalid_disruption_settings_rejected_even_when_inactive(probability, delay):
+    cfg = SimulationConfig(
+        days=10,
+        disruption_probability_per_shipment=probability,
+        disruption_delay_days=delay,
+        seed=1,
+    )
+    with pytest.raises(ValueError):
+        run_single(cfg)
+    with pytest.raises(ValueError):
+        monte_carlo(cfg, replications=2)
+
+
 def test_monte_carlo_supports_demand_peaks():
     cfg = SimulationConfig(
         days=30,
@@ -46,3 +123,50 @@ def test_monte_carlo_supports_demand_peaks():
     mc = monte_carlo(cfg, replications=3)
     assert mc.summary.replications == 3
     assert 0.0 <= mc.summary.kpi_mean["service_level"] <= 1.0
+
+
+def test_demand_multipliers_inclusive_and_compounding():
+    cfg = SimulationConfig(
+        days=10,
+        demand_peaks=(
+            DemandPeak(start_day=2, end_day=4, multiplier=2.0),
+            DemandPeak(start_day=4, end_day=20, multiplier=1.5),
+        ),
+    )
+    mult = _build_demand_multipliers(cfg)
+    assert mult.tolist() == [1.0, 1.0, 2.0, 2.0, 3.0, 1.5, 1.5, 1.5, 1.5, 1.5]
+
+
+def test_demand_multipliers_ignore_negative_bounds():
+    cfg = SimulationConfig(
+        days=8,
+        demand_peaks=(
+            DemandPeak(start_day=0, end_day=-3, multiplier=2.0),
+            DemandPeak(start_day=-2, end_day=3, multiplier=1.5),
+        ),
+    )
+    mult = _build_demand_multipliers(cfg)
+    assert mult.tolist() == [1.5, 1.5, 1.5, 1.5, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_monte_carlo_deterministic_with_seed():
+    cfg = SimulationConfig(days=30, demand_lambda_per_day=10, seed=99)
+    mc1 = monte_carlo(cfg, replications=4)
+    mc2 = monte_carlo(cfg, replications=4)
+    assert mc1.samples == mc2.samples
+    assert len(set(mc1.samples)) > 1
+
+
+def test_monte_carlo_samples_match_run_single_on_spawned_streams():
+    cfg = SimulationConfig(
+        days=40,
+        demand_lambda_per_day=12,
+        disruption_probability_per_shipment=0.2,
+        disruption_delay_days=2.0,
+        seed=5,
+    )
+    mc = monte_carlo(cfg, replications=3)
+
+    streams = np.random.SeedSequence(cfg.seed).spawn(3)
+    expected = [run_single(cfg, rng=np.random.default_rng(s)).kpis for s in streams]
+    assert mc.samples == expected